@@ -1,4 +1,7 @@
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated
+
+from fastapi import APIRouter, Body, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 
 from .dependencies import ServiceDep
 from .schemas.shipment import ShipmentCreate, ShipmentRead, ShipmentUpdate
@@ -9,20 +12,53 @@ from .schemas.shipment import ShipmentCreate, ShipmentRead, ShipmentUpdate
 # all these endpoints (get, post, patch, delete) for easier navigation.
 router = APIRouter(prefix="/shipment", tags=["Shipment"])
 
+# Most shipments a single batch request may read or create
+MAX_BATCH_SIZE = 100
+
+# Built once, validates and serializes a whole batch in pydantic-core
+_shipments_by_id = TypeAdapter(dict[int, ShipmentRead])
+
 
 ### Read a shipment by id
 @router.get("/", response_model=ShipmentRead)
 async def get_shipment(id: int, service: ServiceDep,):
-    # Check for shipment with given id
-    shipment = await service.get(id)
+    # Check for shipment with given id, already serialized (possibly cached)
+    shipment_json = await service.get_json(id)
 
-    if shipment is None:
+    if shipment_json is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Given id doesn't exist!",
         )
 
-    return shipment
+    return Response(content=shipment_json, media_type="application/json")
+
+
+### Read several shipments by id, e.g. /shipment/batch?ids=1&ids=2
+@router.get("/batch", response_model=dict[int, ShipmentRead])
+async def get_shipments(
+    ids: Annotated[list[int], Query(max_length=MAX_BATCH_SIZE)],
+    service: ServiceDep,
+):
+    # Fetch all of them in a single query
+    shipments = await service.get_many(ids)
+
+    if len(shipments) != len(set(ids)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Given id doesn't exist!",
+        )
+
+    # Key by id, rows from IN (...) come back in no particular order
+    batch = _shipments_by_id.validate_python(
+        {shipment.id: shipment for shipment in shipments},
+        from_attributes=True,
+    )
+
+    return Response(
+        content=_shipments_by_id.dump_json(batch),
+        media_type="application/json",
+    )
 
 
 ### Create a new shipment with content and weight
@@ -34,6 +70,15 @@ async def submit_shipment(
     return await service.add(shipment)
 
 
+### Create several shipments at once
+@router.post("/bulk", response_model=list[ShipmentRead])
+async def submit_shipments(
+    shipments: Annotated[list[ShipmentCreate], Body(max_length=MAX_BATCH_SIZE)],
+    service: ServiceDep,
+):
+    return await service.add_many(shipments)
+
+
 ### Update fields of a shipment
 @router.patch("/", response_model=ShipmentRead)
 async def update_shipment(
@@ -41,8 +86,12 @@ async def update_shipment(
     shipment_update: ShipmentUpdate,
     service: ServiceDep,
 ):
-    # Update data with given fields
-    update = shipment_update.model_dump(exclude_none=True)
+    # Update data with given fields, only visiting the ones the client sent
+    update = {
+        field: value
+        for field in shipment_update.model_fields_set
+        if (value := getattr(shipment_update, field)) is not None
+    }
 
     if not update:
         raise HTTPException(
@@ -50,13 +99,25 @@ async def update_shipment(
             detail="No data provided to update",
         )
 
-    return await service.update(id, update)
+    shipment = await service.update(id, update)
+
+    if shipment is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Given id doesn't exist!",
+        )
+
+    return shipment
 
 
 ### Delete a shipment by id
 @router.delete("/")
 async def delete_shipment(id: int, service: ServiceDep) -> dict[str, str]:
     # Remove from database
-    await service.delete(id)
+    if not await service.delete(id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Given id doesn't exist!",
+        )
 
     return {"detail": f"Shipment with id #{id} is deleted!"}
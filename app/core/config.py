@@ -1,4 +1,9 @@
-"""Application configuration."""
+"""Application configuration.
+
+Endpoints are ``async def`` and reach PostgreSQL through the async engine
+in ``app/database/session.py``. Blocking database drivers must not be
+called from them, or every other request waits on the event loop.
+"""
 from pydantic_settings import BaseSettings
 
 
@@ -1,5 +1,7 @@
+from functools import cached_property, lru_cache
 from pathlib import Path
 
+from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Project root: two levels up from app/database/config.py
@@ -8,24 +10,26 @@ ENV_PATH = ROOT_DIR / ".env"
 
 
 class DatabaseSettings(BaseSettings):
-    POSTGRES_PASSWORD: str
+    POSTGRES_PASSWORD: SecretStr
     POSTGRES_USER: str
     POSTGRES_SERVER: str
     POSTGRES_PORT: int
     POSTGRES_DB: str
 
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+
     model_config = SettingsConfigDict(
         env_file=str(ENV_PATH),
         extra="ignore"
     )
 
-    @property
+    @cached_property
     def POSTGRES_URL(self):
-        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
-
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD.get_secret_value()}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
-# Settings loaded from .env file - type checker can't verify .env contents
-settings = DatabaseSettings()  # type: ignore[call-arg]
 
-print(settings)
-print(__file__) # absolute path to current file 
\ No newline at end of file
+# Settings loaded once from .env file - type checker can't verify .env contents
+@lru_cache(maxsize=1)
+def get_settings() -> DatabaseSettings:
+    return DatabaseSettings()  # type: ignore[call-arg]
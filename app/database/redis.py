@@ -0,0 +1,99 @@
+import logging
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, WatchError
+
+from app.database.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a cached shipment expires
+SHIPMENT_CACHE_TTL = 30
+# Seconds a shipment's version stamp outlives its last write,
+# far longer than any request that read it
+SHIPMENT_VERSION_TTL = 3600
+# Seconds to wait on Redis before giving up and using the database
+REDIS_TIMEOUT = 0.25
+
+_settings = get_settings()
+
+# Serialized shipments keyed by id
+_shipment_cache = Redis(
+    host=_settings.REDIS_HOST,
+    port=_settings.REDIS_PORT,
+    db=0,
+    socket_connect_timeout=REDIS_TIMEOUT,
+    socket_timeout=REDIS_TIMEOUT,
+)
+
+
+def _shipment_key(id: int) -> str:
+    return f"shipment:{id}"
+
+
+# Bumped on every write, so a read that raced with a write can tell
+def _version_key(id: int) -> str:
+    return f"shipment:{id}:version"
+
+
+# Responses aren't decoded, so values are bytes; narrow the client's typing
+def _as_bytes(value: bytes | str | None) -> bytes | None:
+    return value.encode() if isinstance(value, str) else value
+
+
+# The cache is best-effort: Redis errors are logged and treated as a miss,
+# so requests fall back to the database instead of failing.
+#
+# Reads are cache-aside. A miss returns the shipment's current version
+# along with the (empty) payload, and cache_shipment() only stores the
+# payload if no write bumped that version in the meantime. That stops a
+# read racing with a PATCH or DELETE from caching the old row. The one
+# window left: if Redis is unreachable when a write commits, the old
+# payload can still be served for up to SHIPMENT_CACHE_TTL seconds.
+
+
+# Returns the cached payload and the version to pass to cache_shipment(),
+# or no version if Redis couldn't be read and the result mustn't be cached
+async def get_cached_shipment(id: int) -> tuple[bytes | None, bytes | None]:
+    try:
+        cached, version = await _shipment_cache.mget(_shipment_key(id), _version_key(id))
+    except RedisError:
+        logger.exception("Failed to read shipment #%s from cache", id)
+        return None, None
+
+    return _as_bytes(cached), _as_bytes(version) or b"0"
+
+
+async def cache_shipment(id: int, shipment_json: str, version: bytes | None):
+    if version is None:
+        return
+
+    try:
+        async with _shipment_cache.pipeline() as pipe:
+            # Abort the SET if a write bumps the version before it runs
+            await pipe.watch(_version_key(id))
+            if (_as_bytes(await pipe.get(_version_key(id))) or b"0") != version:
+                return
+            pipe.multi()
+            pipe.set(_shipment_key(id), shipment_json, ex=SHIPMENT_CACHE_TTL)
+            await pipe.execute()
+    except WatchError:
+        # A write landed while caching, the next read fetches it fresh
+        pass
+    except RedisError:
+        logger.exception("Failed to cache shipment #%s", id)
+
+
+async def invalidate_shipment(id: int):
+    try:
+        async with _shipment_cache.pipeline() as pipe:
+            pipe.incr(_version_key(id))
+            pipe.expire(_version_key(id), SHIPMENT_VERSION_TTL)
+            pipe.delete(_shipment_key(id))
+            await pipe.execute()
+    except RedisError:
+        logger.exception("Failed to invalidate cached shipment #%s", id)
+
+
+async def close_shipment_cache():
+    await _shipment_cache.aclose()
@@ -1,20 +1,28 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from scalar_fastapi import get_scalar_api_reference
-from app.database.session import  create_db_tables
+from app.database.redis import close_shipment_cache
+from app.database.session import  create_db_tables, engine, warm_up_pool
 
 from app.api.router import router
 
 @asynccontextmanager
 async def lifespan_handler(app: FastAPI):
     await create_db_tables()
+    await warm_up_pool()
     yield
+    # Close pooled connections on shutdown
+    await engine.dispose()
+    await close_shipment_cache()
 
 # FastAPI App
 app = FastAPI(
     # Server start/stop listener
     lifespan=lifespan_handler,
+    # Encode responses with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(router)
@@ -1,10 +1,13 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
+from sqlalchemy import delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col, select
 
-from app.api.schemas.shipment import ShipmentCreate
+from app.api.schemas.shipment import ShipmentCreate, ShipmentRead
 from app.database.models import Shipment, ShipmentStatus
+from app.database.redis import cache_shipment, get_cached_shipment, invalidate_shipment
 
 
 class ShipmentService:
@@ -16,6 +19,32 @@ class ShipmentService:
     async def get(self, id: int) -> Optional[Shipment]:
         return await self.session.get(Shipment, id)
 
+    # Get several shipments by id in a single query
+    async def get_many(self, ids: list[int]) -> list[Shipment]:
+        result = await self.session.scalars(
+            select(Shipment).where(col(Shipment.id).in_(ids)),
+        )
+        return list(result)
+
+    # Get a shipment as ShipmentRead JSON, served from the cache when possible
+    async def get_json(self, id: int) -> bytes | str | None:
+        # Version is read before the database so a racing write is detected
+        cached, version = await get_cached_shipment(id)
+        if cached is not None:
+            return cached
+
+        shipment = await self.get(id)
+        if shipment is None:
+            return None
+
+        # Serialize through the read schema so the body matches response_model
+        shipment_json = ShipmentRead.model_validate(
+            shipment, from_attributes=True,
+        ).model_dump_json()
+        await cache_shipment(id, shipment_json, version)
+
+        return shipment_json
+
     # Add a new shipment
     async def add(self, shipment_create: ShipmentCreate) -> Shipment:
         new_shipment = Shipment(
@@ -24,28 +53,58 @@ class ShipmentService:
             estimated_delivery=datetime.now() + timedelta(days=3),
         )
         self.session.add(new_shipment)
+        # The id comes back from INSERT ... RETURNING, no refresh needed
         await self.session.commit()
-        await self.session.refresh(new_shipment)
 
         return new_shipment
 
+    # Add several shipments with a single batched INSERT
+    async def add_many(self, shipments_create: list[ShipmentCreate]) -> list[Shipment]:
+        estimated_delivery = datetime.now() + timedelta(days=3)
+        new_shipments = [
+            Shipment(
+                **shipment_create.model_dump(),
+                status=ShipmentStatus.placed,
+                estimated_delivery=estimated_delivery,
+            )
+            for shipment_create in shipments_create
+        ]
+        self.session.add_all(new_shipments)
+        await self.session.commit()
+
+        return new_shipments
+
     # Update an existing shipment
-    async def update(self, id: int, shipment_update: dict) -> Shipment:
-        shipment = await self.get(id)
+    async def update(self, id: int, shipment_update: dict) -> Optional[Shipment]:
+        # Update and read back the row in a single statement
+        shipment = await self.session.scalar(
+            update(Shipment)
+            .where(col(Shipment.id) == id)
+            .values(**shipment_update)
+            .returning(Shipment),
+        )
         if shipment is None:
-            raise ValueError(f"Shipment with id {id} not found")
-        shipment.sqlmodel_update(shipment_update)
+            return None
 
-        self.session.add(shipment)
         await self.session.commit()
-        await self.session.refresh(shipment)
+        # Drop the stale cached response
+        await invalidate_shipment(id)
 
         return shipment
 
-    # Delete a shipment
-    async def delete(self, id: int) -> None:
-        shipment = await self.get(id)
-        if shipment is None:
-            raise ValueError(f"Shipment with id {id} not found")
-        await self.session.delete(shipment)
-        await self.session.commit()
\ No newline at end of file
+    # Delete a shipment, returns False if it doesn't exist
+    async def delete(self, id: int) -> bool:
+        # Delete without loading the row first
+        deleted_id = await self.session.scalar(
+            delete(Shipment)
+            .where(col(Shipment.id) == id)
+            .returning(col(Shipment.id)),
+        )
+        if deleted_id is None:
+            return False
+
+        await self.session.commit()
+        # Drop the stale cached response
+        await invalidate_shipment(id)
+
+        return True
\ No newline at end of file
@@ -2,15 +2,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from .app.core.config import settings
 
-from rich import print, panel
 # The merit of async lifespan is consistency with FastAPI’s async model and the ability to do useful async work at startup when you have it (async DB, HTTP, etc.).
 @asynccontextmanager
 async def lifespan_handler(app: FastAPI):
-    print(panel.Panel("Server started...", border_style="green"))
+    print("Server started...")
     yield
-    print(panel.Panel("...stopped!", border_style="red"))
-
-# init_db()
+    print("...stopped!")
 
 app = FastAPI(
     title=settings.APP_TITLE,